@@ -7,7 +7,6 @@ import time
 from datetime import datetime
 
 import runez
-from runez.pyenv import PypiStd, PythonDepot, PythonInstallationScanner, Version
 
 
 __version__ = "3.5.6"
@@ -23,6 +22,8 @@ K_LEAVES = {
 PLATFORM = platform.system().lower()
 
 DEFAULT_PYPI = "https://pypi.org/simple"
+RX_NON_WORD = re.compile(r"\W+")
+RX_WRAPPED_CANONICAL = re.compile(r"\.pickley/([^/]+)/.+/bin/")  # TODO: Remove once pickley 3.4 is phased out
 
 
 def abort(message):
@@ -77,6 +78,8 @@ def specced(name, version):
 
 
 def pypi_name_problem(name):
+    from runez.pyenv import PypiStd
+
     if not PypiStd.is_acceptable(name):
         note = None
         problem = f"'{runez.red(name)}' is not a valid pypi package name"
@@ -90,6 +93,38 @@ def pypi_name_problem(name):
         return problem
 
 
+def declared_metadata(folder):
+    """
+    Args:
+        folder (str): Folder containing a python project
+
+    Returns:
+        (str | None, str | None): Package name and version, if statically declared in pyproject.toml or setup.cfg
+    """
+    path = os.path.join(folder, "pyproject.toml")
+    if os.path.exists(path):
+        try:
+            import tomllib  # Available in python3.11+ only
+
+            with open(path, "rb") as fh:
+                project = tomllib.load(fh).get("project")
+
+            if isinstance(project, dict) and "version" not in project.get("dynamic", ()):
+                if project.get("name") and project.get("version"):
+                    return project["name"], project["version"]
+
+        except (ImportError, ValueError):
+            pass
+
+    metadata = runez.file.ini_to_dict(os.path.join(folder, "setup.cfg")).get("metadata", {})
+    name = metadata.get("name")
+    version = metadata.get("version")
+    if name and version and not version.startswith(("attr:", "file:")):
+        return name, version
+
+    return None, None
+
+
 def _dynamic_resolver(cfg, name_or_url):
     package_name, package_version = despecced(name_or_url)
     if package_version:
@@ -99,7 +134,7 @@ def _dynamic_resolver(cfg, name_or_url):
     folder = None
     is_git = "://" in name_or_url or name_or_url.endswith(".git")
     if is_git or "/" in name_or_url:
-        safe_name = re.sub(r"\W+", "-", name_or_url).strip("-")
+        safe_name = RX_NON_WORD.sub("-", name_or_url).strip("-")
         folder = name_or_url if not is_git else cfg.cache.full_path("checkout", safe_name)
         cached_resolved = cfg.cache.full_path(f"{safe_name}.rlv")
         info = runez.read_json(cached_resolved)
@@ -123,20 +158,22 @@ def _dynamic_resolver(cfg, name_or_url):
         if not os.path.exists(setup_py):
             abort(f"No setup.py in '{runez.red(runez.short(folder))}'")
 
-        with runez.CurrentFolder(folder):
-            # Some setup.py's assume current folder is the one with their setup.py
-            r = runez.run(sys.executable, "setup.py", "--name", dryrun=False, fatal=False, logger=False)
-            package_name = r.output
-            if r.failed or not package_name:
-                abort(f"Could not determine package name from '{runez.red(runez.short(setup_py))}'")
+        package_name, package_version = declared_metadata(folder)
+        if not package_name or not package_version:
+            with runez.CurrentFolder(folder):
+                # Some setup.py's assume current folder is the one with their setup.py
+                r = runez.run(sys.executable, "setup.py", "--name", dryrun=False, fatal=False, logger=False)
+                package_name = r.output
+                if r.failed or not package_name:
+                    abort(f"Could not determine package name from '{runez.red(runez.short(setup_py))}'")
 
-            r = runez.run(sys.executable, "setup.py", "--version", dryrun=False, fatal=False, logger=False)
-            package_version = r.output
-            if r.failed or not package_version:
-                abort("Could not determine package version from setup.py")
+                r = runez.run(sys.executable, "setup.py", "--version", dryrun=False, fatal=False, logger=False)
+                package_version = r.output
+                if r.failed or not package_version:
+                    abort("Could not determine package version from setup.py")
 
-            runez.save_json(dict(resolved=[package_name, package_version]), cached_resolved)
-            return package_name, package_version, folder
+        runez.save_json(dict(resolved=[package_name, package_version]), cached_resolved)
+        return package_name, package_version, folder
 
     return package_name, package_version, None
 
@@ -168,6 +205,8 @@ class PackageSpec:
             cfg (PickleyConfig): Associated configuration
             name_or_url (str): Provided package reference (either name, folder or git url)
         """
+        from runez.pyenv import PypiStd
+
         self.cfg = cfg
         self.original = name_or_url
         self.name, self.given_version, self.folder = _dynamic_resolver(cfg, name_or_url)
@@ -216,6 +255,8 @@ class PackageSpec:
                 self._desired_track = TrackedVersion(source="pinned", version=self.pinned)
 
             else:
+                from runez.pyenv import Version
+
                 self._desired_track = self.get_latest()  # By default, the latest is desired
                 candidates = []
                 if self.is_currently_installed:
@@ -252,7 +293,7 @@ class PackageSpec:
     @runez.cached_property
     def ping_path(self):
         """Path to .ping file (for throttle auto-upgrade checks)"""
-        return self.cfg.cache.full_path(f"{self.dashed}.ping")
+        return self.cfg.ping_path(self.dashed)
 
     @runez.cached_property
     def active_install_path(self):
@@ -278,10 +319,16 @@ class PackageSpec:
 
         return [f"{self.dashed}=={self.desired_track.version}"]
 
-    def get_lock_path(self):
+    @runez.cached_property
+    def lock_path(self):
         """str: Path to lock file used during installation for this package"""
         return self.cfg.meta.full_path(f"{self.dashed}.lock")
 
+    @runez.cached_property
+    def latest_path(self):
+        """str: Path to file tracking latest version of this package (as determined from pypi)"""
+        return self.cfg.cache.full_path(f"{self.dashed}.latest")
+
     def skip_reason(self, force=False):
         """str: Reason for skipping installation, when applicable"""
         if not force and self.cfg.facultative(pspec=self):
@@ -335,11 +382,14 @@ class PackageSpec:
             return [f"{self.wheelified}-{self.desired_track.version}-py3-none-any.whl"]
 
         result = []
-        if folder and os.path.isdir(folder):
+        if folder:
             prefix = f"{self.wheelified}-"
-            for fname in os.listdir(folder):
-                if fname.startswith(prefix):
-                    result.append(os.path.join(folder, fname))
+            try:
+                with os.scandir(folder) as entries:
+                    result = [os.path.join(folder, e.name) for e in entries if e.name.startswith(prefix)]
+
+            except (FileNotFoundError, NotADirectoryError):
+                pass
 
             if len(result) == 1:
                 return result[0]
@@ -353,12 +403,14 @@ class PackageSpec:
             runez.delete(candidate, fatal=False)
 
     def installed_sibling_folders(self):
-        folder = runez.to_path(self.cfg.meta.path)
-        if folder.is_dir():
-            prefix = f"{self.dashed}-"
-            for item in folder.iterdir():
-                if item.name.startswith(prefix):
-                    yield item, item.name[len(prefix):]
+        """
+        Yields:
+            (os.DirEntry, str): Installation folder in DOT_META/ related to this package spec, and its version
+        """
+        prefix = f"{self.dashed}-"
+        entries = [entry for entry in self.cfg.meta.iterdir() if entry.name.startswith(prefix)]  # Callers may delete entries
+        for entry in entries:
+            yield entry, entry.name[len(prefix):]
 
     def groom_installation(self, keep_for=60):
         """
@@ -369,17 +421,17 @@ class PackageSpec:
         manifest = self.manifest
         now = time.time()
         for candidate, version in self.installed_sibling_folders():
-            age = now - os.path.getmtime(candidate)
+            age = now - candidate.stat().st_mtime
             if version != manifest.version:
                 candidates.append((age, candidate))
 
         if not candidates:
             return
 
-        candidates = sorted(candidates)
-        youngest = candidates[0]
-        for candidate in candidates[1:]:
-            runez.delete(candidate[1], fatal=False)
+        youngest = min(candidates, key=lambda c: c[0])
+        for candidate in candidates:
+            if candidate is not youngest:
+                runez.delete(candidate[1], fatal=False)
 
         if youngest[0] > (keep_for * runez.date.SECONDS_IN_ONE_MINUTE):
             runez.delete(youngest[1], fatal=False)
@@ -401,7 +453,7 @@ class PackageSpec:
     def get_latest(self, force=False):
         """Tracked in DOT_META/.cache/<package>.latest"""
         if force or self._latest is None:
-            path = self.cfg.cache.full_path(f"{self.dashed}.latest")
+            path = self.latest_path
             if not force:
                 age = self.cfg.version_check_delay(self)
                 if age and runez.file.is_younger(path, age):
@@ -441,15 +493,35 @@ class PickleyConfig:
     def __init__(self):
         self.configs = []
         self.config_path = None
-        self.pip_conf, self.pip_conf_index = get_default_index("~/.config/pip/pip.conf", "/etc/pip.conf")
-        self.default_index = self.pip_conf_index or DEFAULT_PYPI
         self._explored = set()
 
     def __repr__(self):
         return "<not-configured>" if self.base is None else runez.short(self.base)
 
+    @runez.cached_property
+    def _pip_conf_info(self):
+        # Looked up lazily, many commands don't need to know which index is configured in pip.conf
+        return get_default_index("~/.config/pip/pip.conf", "/etc/pip.conf")
+
+    @property
+    def pip_conf(self):
+        """str | None: Path to pip.conf file that defines the default index, if any"""
+        return self._pip_conf_info[0]
+
+    @property
+    def pip_conf_index(self):
+        """str | None: Index configured in pip.conf, if any"""
+        return self._pip_conf_info[1]
+
+    @property
+    def default_index(self):
+        """str: Default pypi index to use"""
+        return self.pip_conf_index or DEFAULT_PYPI
+
     @runez.cached_property
     def available_pythons(self):
+        from runez.pyenv import PythonDepot, PythonInstallationScanner
+
         pyenv = self.pyenv()
         scanner = PythonInstallationScanner(pyenv) if pyenv else None
         depot = PythonDepot(scanner=scanner)
@@ -579,11 +651,6 @@ class PickleyConfig:
 
         return self.installed_specs()
 
-    @runez.cached_property
-    def _wrapped_canonical_regex(self):
-        # TODO: Remove once pickley 3.4 is phased out
-        return re.compile(r"\.pickley/([^/]+)/.+/bin/")
-
     def _wrapped_canonical(self, path):
         """(str | None): Canonical name of installed python package, if installed via pickley wrapper"""
         if runez.is_executable(path):
@@ -591,14 +658,14 @@ class PickleyConfig:
                 if line.startswith("# pypi-package:"):
                     return line[15:].strip()
 
-                m = self._wrapped_canonical_regex.search(line)
+                m = RX_WRAPPED_CANONICAL.search(line)
                 if m:  # pragma: no cover, TODO: Remove once pickley 3.4 is phased out
                     return m.group(1)
 
     def scan_installed(self):
         """Scan installed"""
         for item in self.base.iterdir():
-            spec_name = self._wrapped_canonical(item)
+            spec_name = self._wrapped_canonical(item.path)
             if spec_name:
                 yield spec_name
 
@@ -698,6 +765,16 @@ class PickleyConfig:
             if isinstance(pinned, str):
                 return pinned
 
+    def ping_path(self, dashed):
+        """
+        Args:
+            dashed (str): Canonical pypi package name
+
+        Returns:
+            (str): Path to .ping file (for throttle auto-upgrade checks)
+        """
+        return self.cache.full_path(f"{dashed}.ping")
+
     def pyenv(self):
         """
         Returns:
@@ -792,6 +869,8 @@ class TrackedVersion:
         Returns:
             (TrackedVersion):
         """
+        from runez.pyenv import PypiStd
+
         index = index or pspec.index or pspec.cfg.default_index
         version = PypiStd.latest_pypi_version(pspec.dashed, index=index, include_prerelease=include_prerelease)
         if not version:
@@ -958,9 +1037,13 @@ class FolderBase:
         return self.path
 
     def iterdir(self):
-        path = runez.to_path(self.path)
-        if path.is_dir():
-            yield from path.iterdir()
+        """Yields (os.DirEntry): Entries in this folder, if it exists"""
+        try:
+            with os.scandir(self.path) as entries:
+                yield from entries
+
+        except (FileNotFoundError, NotADirectoryError):
+            return
 
     def full_path(self, *relative):
         """
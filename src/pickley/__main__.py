@@ -1,7 +1,16 @@
 """Allows to run via python -m pickley"""
 
+import sys
+
 
 def main():
+    if sys.argv[1:] == ["--version"]:
+        # Fast path: no need to import click and the full CLI just to show version ('--help' needs the click command tree)
+        from pickley import __version__
+
+        print(__version__)
+        return
+
     import runez
 
     from pickley.cli import main, SoftLockException
@@ -2,12 +2,11 @@
 Bootstrap pickley
 """
 
-import argparse
 import json
 import os
 import re
 import shutil
-import ssl
+import stat
 import subprocess  # nosec
 import sys
 import tempfile
@@ -25,6 +24,7 @@ def abort(message):
 
 
 def built_in_download(target, url):
+    import ssl
     from urllib.request import Request, urlopen
 
     request = Request(url)
@@ -106,7 +106,13 @@ def hdry(message, dryrun=None):
 
 
 def is_executable(path):
-    return path and os.path.isfile(path) and os.access(path, os.X_OK)
+    if path:
+        try:
+            st = os.stat(path)
+            return stat.S_ISREG(st.st_mode) and os.access(path, os.X_OK)
+
+        except OSError:
+            return False
 
 
 def is_writable(path):
@@ -192,12 +198,16 @@ def short(text):
     if TMP_FOLDER:
         text = text.replace(TMP_FOLDER + os.path.sep, "")
 
-    return text.replace(HOME, "~")
+    if text == HOME or text.startswith(HOME + os.path.sep):
+        return "~" + text[len(HOME):]
+
+    return text
 
 
 def which(program):
+    own_bin = RUNNING_FROM_VENV and os.path.join(sys.prefix, "bin")
     for p in os.environ.get("PATH", "").split(os.pathsep):
-        if not RUNNING_FROM_VENV or p != os.path.join(sys.prefix, "bin"):
+        if p != own_bin:
             fp = os.path.join(p, program)
             if fp and is_executable(fp):
                 return fp
@@ -271,6 +281,8 @@ def find_venv_exe(folder, name):
 
 def main(args=None):
     """Bootstrap pickley"""
+    import argparse
+
     global DRYRUN
     global TMP_FOLDER
 
@@ -10,15 +10,14 @@ from collections import namedtuple
 
 import click
 import runez
-from runez.pyenv import Version
 from runez.render import PrettyTable
 
 from pickley import __version__, abort, despecced, DOT_META, inform, PackageSpec, PICKLEY, PickleyConfig, specced
-from pickley.package import PexPackager, PythonVenv, VenvPackager
 
 
 LOG = logging.getLogger(__name__)
-PACKAGER = VenvPackager  # Packager to use for this run
+AUDIT_LOG_MAX_SIZE = 500 * 1024  # audit.log gets rotated once it reaches this size (in bytes)
+PACKAGER = None  # Name of packager to use for this run (default: venv)
 CFG = PickleyConfig()
 
 Requirements = namedtuple("Requirements", ["requirement_files", "additional_packages", "project"])
@@ -39,16 +38,45 @@ def setup_audit_log(cfg=CFG):
         log_path = cfg.meta.full_path("audit.log")
         runez.log.trace("Logging to %s", log_path)
         runez.ensure_folder(cfg.meta.path)
+        rotate_log(log_path, AUDIT_LOG_MAX_SIZE)
         runez.log.setup(
             file_format="%(asctime)s %(timezone)s [%(process)s] %(context)s%(levelname)s - %(message)s",
             file_level=logging.DEBUG,
             file_location=log_path,
             greetings=":: {argv}",
-            rotate="size:500k",
-            rotate_count=1,
         )
 
 
+def rotate_log(path, max_size):
+    """
+    Rotate log file once per run, instead of having a RotatingFileHandler check file size on each emitted record
+
+    Args:
+        path (str): Path to log file
+        max_size (int): Size in bytes at which to rotate log file (one backup is kept, with '.1' suffix)
+    """
+    try:
+        if os.path.getsize(path) >= max_size:
+            os.replace(path, f"{path}.1")
+
+    except OSError:
+        pass  # Log file does not exist yet
+
+
+def get_packager(name=None):
+    """
+    Args:
+        name (str | None): Name of packager to use (default: venv)
+
+    Returns:
+        (type): Corresponding `pickley.package.Packager` implementation
+    """
+    # Imported lazily: most commands never need pickley.package
+    from pickley.package import PexPackager, VenvPackager
+
+    return PexPackager if name == "pex" else VenvPackager
+
+
 class SoftLockException(Exception):
     """Raised when soft lock can't be acquired"""
 
@@ -67,7 +95,7 @@ class SoftLock:
             invalid (int | None): Age in seconds after which to consider existing lock as invalid
         """
         self.pspec = pspec
-        self.lock_path = pspec.get_lock_path()
+        self.lock_path = pspec.lock_path
         self.give_up = give_up or pspec.cfg.install_timeout(pspec) or 120
         self.invalid = invalid or self.give_up * 2
 
@@ -112,7 +140,7 @@ class SoftLock:
             print(f"Would acquire {runez.short(self.lock_path)}")
 
         else:
-            runez.log.trace(f"Acquired {runez.short(self.lock_path)}")
+            runez.log.trace("Acquired %s", runez.short(self.lock_path))
 
         runez.write(self.lock_path, runez.joined(os.getpid(), runez.quoted(sys.argv[1:]), delimiter="\n"), logger=False)
         return self
@@ -123,7 +151,7 @@ class SoftLock:
             print(f"Would release {runez.short(self.lock_path)}")
 
         else:
-            runez.log.trace(f"Released {runez.short(self.lock_path)}")
+            runez.log.trace("Released %s", runez.short(self.lock_path))
 
         if CFG.base:
             runez.Anchored.pop(CFG.base.path)
@@ -171,7 +199,7 @@ def perform_install(pspec, is_upgrade=False, force=False, quiet=False, no_binary
             return
 
         setup_audit_log()
-        manifest = PACKAGER.install(pspec, no_binary=no_binary)
+        manifest = get_packager(PACKAGER).install(pspec, no_binary=no_binary)
         if manifest and not quiet:
             note = f" in {runez.represented_duration(time.time() - started)}"
             verb += "d" if verb.endswith("e") else "ed"
@@ -184,6 +212,40 @@ def perform_install(pspec, is_upgrade=False, force=False, quiet=False, no_binary
         pspec.groom_installation()
 
 
+def prefetch(specs, lookup):
+    """
+    Args:
+        specs (list[PackageSpec]): Package specs to look up
+        lookup (callable): Lookup to perform on each spec (typically network bound, like querying pypi for latest version)
+    """
+    if len(specs) <= 1:
+        for pspec in specs:
+            lookup(pspec)
+
+        return
+
+    # Imported lazily: only needed by commands that look up several packages
+    from concurrent.futures import ThreadPoolExecutor
+
+    runez.ensure_folder(specs[0].cfg.cache.path, logger=False)  # Lookups save their results in this folder
+    with ThreadPoolExecutor(max_workers=min(8, len(specs))) as executor:
+        for _ in executor.map(lookup, specs):
+            pass  # Consume results, to surface any exception raised by a lookup
+
+
+def prefetch_latest_versions(specs):
+    """
+    Query pypi for the latest version of 'specs' upfront, in parallel (installations remain sequential).
+    Only the pypi lookup is done here: manifests are read later, by perform_install(), while holding the package's lock.
+
+    Args:
+        specs (list[PackageSpec]): Package specs about to be installed or upgraded
+    """
+    specs = [p for p in specs if not p.given_version and not p.pinned]
+    if len(specs) > 1:
+        prefetch(specs, lambda p: p.get_latest())
+
+
 def _find_base_from_program_path(path):
     if not path or len(path) <= 1:
         return None
@@ -206,7 +268,7 @@ def find_base(path=None):
         if not os.path.isdir(base_path):
             abort(f"PICKLEY_ROOT points to non-existing directory {runez.red(base_path)}")
 
-        return runez.resolved_path(base_path)
+        return base_path
 
     path = path or runez.resolved_path(sys.argv[0])
     return _find_base_from_program_path(path) or os.path.dirname(path)
@@ -216,7 +278,7 @@ def clean_env_vars(*keys):
     """Ensure given env vars are removed if present"""
     for key in keys:
         if key in os.environ:
-            runez.log.trace(f"Unsetting env var {key}")
+            runez.log.trace("Unsetting env var %s", key)
             del os.environ[key]
 
 
@@ -235,7 +297,7 @@ def clean_env_vars(*keys):
 def main(ctx, debug, config, index, python, delivery, packager, virtualenv):
     """Package manager for python CLIs"""
     global PACKAGER
-    PACKAGER = PexPackager if packager == "pex" else VenvPackager
+    PACKAGER = packager
     runez.system.AbortException = SystemExit
     level = logging.WARNING
     if ctx.invoked_subcommand == "package":
@@ -254,7 +316,7 @@ def main(ctx, debug, config, index, python, delivery, packager, virtualenv):
     if runez.SYS_INFO.platform_id.is_macos and "ARCHFLAGS" not in os.environ and runez.SYS_INFO.platform_id.arch:
         # Ensure the proper platform is used on macos
         archflags = f"-arch {runez.SYS_INFO.platform_id.arch}"
-        runez.log.trace(f"Setting ARCHFLAGS={archflags}")
+        runez.log.trace("Setting ARCHFLAGS=%s", archflags)
         os.environ["ARCHFLAGS"] = archflags
 
     CFG.set_cli(config, delivery, index, python, virtualenv)
@@ -290,15 +352,21 @@ def auto_heal():
 @click.argument("package", required=True)
 def auto_upgrade(force, package):
     """Background auto-upgrade command (called by wrapper)"""
-    pspec = PackageSpec(CFG, package)
-    ping = pspec.ping_path
+    from runez.pyenv import PypiStd
+
+    # Cheap check first: no need to resolve package spec if we're going to skip the auto-upgrade anyway
+    dashed = PypiStd.std_package_name(despecced(package)[0])
+    pspec = None if dashed else PackageSpec(CFG, package)  # Folders and git urls need a full PackageSpec to be named
+    ping = CFG.ping_path(dashed) if dashed else pspec.ping_path
     if not force and runez.file.is_younger(ping, 5):  # 5 seconds cool down on version check to avoid bursts
         LOG.debug("Skipping auto-upgrade, checked recently")
         sys.exit(0)
 
-    runez.touch(ping)
-    lock_path = pspec.get_lock_path()
-    if runez.file.is_younger(lock_path, CFG.install_timeout(pspec)):
+    if pspec is None:
+        pspec = PackageSpec(CFG, package)
+
+    runez.touch(pspec.ping_path)
+    if runez.file.is_younger(pspec.lock_path, CFG.install_timeout(pspec)):
         LOG.debug("Lock file present, another installation is in progress")
         sys.exit(0)
 
@@ -313,6 +381,7 @@ def base(what):
     if what == "bootstrap-own-wrapper":
         # Internal: called by bootstrap script
         from pickley.delivery import DeliveryMethodWrap
+        from pickley.package import PythonVenv
 
         pspec = PackageSpec(CFG, f"{PICKLEY}=={__version__}")
         venv = PythonVenv(pspec.active_install_path, pspec, create=False)
@@ -355,13 +424,14 @@ def check(force, packages):
         print("No packages installed")
         sys.exit(0)
 
+    skip_reasons = {pspec.dashed: pspec.skip_reason(force) for pspec in packages}
+    prefetch([p for p in packages if not skip_reasons[p.dashed]], lambda p: p.get_latest(force=force))
     for pspec in packages:
-        skip_reason = pspec.skip_reason(force)
+        skip_reason = skip_reasons[pspec.dashed]
         if skip_reason:
             print(f"{pspec}: {runez.bold('skipped')}, {runez.dim(skip_reason)}]")
             continue
 
-        pspec.get_latest(force=force)
         dv = pspec.desired_track.version
         if pspec.desired_track.problem:
             msg = pspec.desired_track.problem
@@ -415,8 +485,10 @@ def diagnostics():
 @click.argument("packages", nargs=-1, required=True)
 def install(force, no_binary, packages):
     """Install a package from pypi"""
-    setup_audit_log()
     specs = CFG.package_specs(packages, include_pickley=packages and packages[0].startswith("bundle:"))
+    if not force:
+        prefetch_latest_versions(specs)
+
     for pspec in specs:
         perform_install(pspec, is_upgrade=False, force=force, quiet=False, no_binary=no_binary)
 
@@ -552,8 +624,17 @@ class RunSetup:
 
         runez.log.progress.stop()
         path = pspec.exe_path(rs.command)
-        r = runez.run(path, args, stdout=None, stderr=None, fatal=False)
-        sys.exit(r.exit_code)
+        if runez.DRYRUN:
+            r = runez.run(path, args, stdout=None, stderr=None, fatal=False)
+            sys.exit(r.exit_code)
+
+        if not runez.is_executable(path):
+            abort(f"'{runez.red(runez.short(path))}' is not available")
+
+        # Replace current process with the target command (no need to wait on a child process)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.execv(path, [path, *args])
 
     @classmethod
     def cmd_aws(cls):
@@ -593,7 +674,7 @@ def upgrade(packages):
         inform("No packages installed, nothing to upgrade")
         sys.exit(0)
 
-    setup_audit_log()
+    prefetch_latest_versions(packages)
     for pspec in packages:
         perform_install(pspec, is_upgrade=True, force=False, quiet=False)
 
@@ -635,6 +716,8 @@ def uninstall(all, packages):
 @click.argument("programs", nargs=-1)
 def version_check(system, programs):
     """Check that programs are present with a minimum version"""
+    from runez.pyenv import Version
+
     if not programs:
         runez.abort("Specify at least one program to check")
 
@@ -677,6 +760,8 @@ def version_check(system, programs):
 
 def parsed_version(text):
     """Parse --version from text, in reverse order to avoid being fulled by warnings..."""
+    from runez.pyenv import Version
+
     if text:
         for line in reversed(text.splitlines()):
             version = Version.from_text(line)
@@ -763,7 +848,7 @@ class PackageFinalizer:
             abort(f"Folder {runez.red(runez.short(self.folder))} does not exist")
 
         self.pspec = PackageSpec(self.cfg, self.folder)
-        LOG.info(f"Using python: {self.pspec.python}")
+        LOG.info("Using python: %s", self.pspec.python)
         if self.dist.startswith("root/"):
             # Special case: we're targeting 'root/...' probably for a debian, use target in that case to avoid venv relocation issues
             target = self.dist[4:]
@@ -781,7 +866,7 @@ class PackageFinalizer:
         with runez.Anchored(self.folder, self.cfg.base.path):
             runez.ensure_folder(self.cfg.base.path, clean=True, logger=False)
             dist_folder = runez.resolved_path(self.dist)
-            exes = PACKAGER.package(self.pspec, self.cfg.base.path, dist_folder, self.requirements, self.compile)
+            exes = get_packager(PACKAGER).package(self.pspec, self.cfg.base.path, dist_folder, self.requirements, self.compile)
             if exes:
                 report = PrettyTable(["Packaged executable", self.sanity_check], border=self.border)
                 report.header.style = "bold"
@@ -826,7 +911,7 @@ class Symlinker:
                 inform(f"Symlinked {runez.short(dest)} -> {runez.short(exe)}")
 
         else:
-            LOG.debug(f"'{exe}' does not exist, skipping symlink")
+            LOG.debug("'%s' does not exist, skipping symlink", exe)
 
 
 def delete_file(path):
@@ -69,13 +69,11 @@ class DeliveryMethod:
         Returns:
             (DeliveryMethod): Associated delivery method
         """
-        if name == "wrap":
-            return DeliveryMethodWrap()
+        impl = DELIVERY_METHODS.get(name)
+        if impl is None:
+            return abort(f"Unknown delivery method '{runez.red(name)}'")
 
-        if name == "symlink":
-            return DeliveryMethodSymlink()
-
-        return abort(f"Unknown delivery method '{runez.red(name)}'")
+        return impl()
 
     def install(self, venv, entry_points):
         """
@@ -88,8 +86,9 @@ class DeliveryMethod:
 
         try:
             prev_manifest = venv.pspec.manifest
+            bin_folder = os.path.join(venv.pspec.active_install_path, "bin")
             for name in entry_points:
-                src = os.path.join(venv.pspec.active_install_path, "bin", name)
+                src = os.path.join(bin_folder, name)
                 dest = venv.pspec.exe_path(name)
                 ssrc = runez.short(src)
                 sdest = runez.short(dest)
@@ -100,7 +99,7 @@ class DeliveryMethod:
                 if not os.path.exists(src):
                     abort(f"Can't {self.short_name} {sdest} -> {runez.red(ssrc)}: source does not exist")
 
-                LOG.debug(f"{self.action} {sdest} -> {ssrc}")
+                LOG.debug("%s %s -> %s", self.action, sdest, ssrc)
                 self._install(venv.pspec, dest, src)
 
             manifest = venv.pspec.save_manifest(entry_points)
@@ -167,3 +166,6 @@ class DeliveryMethodWrap(DeliveryMethod):
         runez.delete(target, logger=False)
         runez.write(target, contents, logger=False)
         runez.make_executable(target, logger=False)
+
+
+DELIVERY_METHODS = {m.short_name: m for m in (DeliveryMethodSymlink, DeliveryMethodWrap)}
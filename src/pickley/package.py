@@ -120,8 +120,7 @@ class PackageContents:
                 if isinstance(commands, dict):
                     wrap_console = commands.get("wrap_console")
                     if wrap_console:
-                        nb = runez.plural(wrap_console, "entry point")
-                        runez.log.trace(f"Found {nb} in metadata.json")
+                        runez.log.trace("Found %s in metadata.json", runez.plural(wrap_console, "entry point"))
                         return wrap_console
 
         entry_points_txt = self.dist_info.files.get("entry_points.txt")
@@ -129,13 +128,11 @@ class PackageContents:
             metadata = runez.file.ini_to_dict(entry_points_txt)
             console_scripts = metadata.get("console_scripts")
             if console_scripts:
-                nb = runez.plural(console_scripts, "entry point")
-                runez.log.trace(f"Found {nb} in entry_points.txt")
+                runez.log.trace("Found %s in entry_points.txt", runez.plural(console_scripts, "entry point"))
                 return console_scripts
 
         if self.bin.files:
-            nb = runez.plural(self.bin.files, "bin/ script")
-            runez.log.trace(f"Found {nb}")
+            runez.log.trace("Found %s", runez.plural(self.bin.files, "bin/ script"))
 
         return self.bin.files or None
 
@@ -1,8 +1,10 @@
+import sys
+
 import pytest
 import runez
 from runez.pyenv import PypiStd
 
-from pickley import __version__, despecced, DOT_META, get_default_index, PackageSpec
+from pickley import __version__, declared_metadata, despecced, DOT_META, get_default_index, PackageSpec
 from pickley import PickleyConfig, pypi_name_problem, specced
 
 
@@ -87,6 +89,28 @@ def test_bogus_config(temp_folder, logged):
     assert "No suitable python" in logged.pop()
 
 
+def test_declared_metadata(temp_cfg):
+    assert declared_metadata("foo") == (None, None)
+
+    runez.write("foo/setup.cfg", "[metadata]\nname = foo\nversion = attr: foo.__version__", logger=False)
+    assert declared_metadata("foo") == (None, None)
+
+    runez.write("foo/setup.cfg", "[metadata]\nname = foo\nversion = 1.0", logger=False)
+    assert declared_metadata("foo") == ("foo", "1.0")
+
+    runez.write("foo/pyproject.toml", '[project]\nname = "bar"\ndynamic = ["version"]', logger=False)
+    assert declared_metadata("foo") == ("foo", "1.0")
+
+    runez.write("foo/pyproject.toml", '[project]\nname = "bar"\nversion = "2.0"', logger=False)
+    expected = ("bar", "2.0") if sys.version_info[:2] >= (3, 11) else ("foo", "1.0")
+    assert declared_metadata("foo") == expected
+
+    # No need to run setup.py when metadata is declared statically
+    runez.write("foo/setup.py", "import sys\nsys.exit(1)", logger=False)
+    pspec = PackageSpec(temp_cfg, "./foo")
+    assert (pspec.name, pspec.given_version) == expected
+
+
 def test_default_index(temp_folder, logged):
     assert get_default_index() == (None, None)
 
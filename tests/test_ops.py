@@ -1,4 +1,5 @@
 import os
+import sys
 import time
 from unittest.mock import patch
 
@@ -7,14 +8,27 @@ import runez
 from runez.http import GlobalHttpCalls
 from runez.pyenv import Version
 
-from pickley import __version__, PackageSpec, PICKLEY, PickleyConfig, TrackedManifest, TrackedVersion
-from pickley.cli import clean_compiled_artifacts, find_base, PackageFinalizer, Requirements, SoftLock, SoftLockException
+from pickley import __main__, __version__, PackageSpec, PICKLEY, PickleyConfig, TrackedManifest, TrackedVersion
+from pickley.cli import clean_compiled_artifacts, find_base, PackageFinalizer, prefetch, Requirements, rotate_log, SoftLock
+from pickley.cli import prefetch_latest_versions, SoftLockException
 from pickley.delivery import WRAPPER_MARK
 from pickley.package import Packager
 
 from .conftest import dot_meta
 
 
+def test_auto_upgrade_cool_down(cli):
+    runez.touch(dot_meta(".cache/mgit.ping"), logger=False)
+    cli.expect_success("--debug auto-upgrade mgit", "Skipping auto-upgrade, checked recently")
+    cli.expect_success("--debug auto-upgrade mgit==1.0", "Skipping auto-upgrade, checked recently")
+
+    # Folders and git urls are named via their PackageSpec
+    runez.write("foo/setup.py", "import sys\nsys.exit(1)", logger=False)
+    runez.write("foo/setup.cfg", "[metadata]\nname = foo\nversion = 1.0", logger=False)
+    runez.touch(dot_meta(".cache/foo.ping"), logger=False)
+    cli.expect_success("--debug auto-upgrade ./foo", "Skipping auto-upgrade, checked recently")
+
+
 def test_base(cli, monkeypatch):
     monkeypatch.setenv("__PYVENV_LAUNCHER__", "foo")
     folder = os.getcwd()
@@ -383,6 +397,12 @@ def test_main(cli):
     cli.exercise_main("-mpickley", "src/pickley/bstrap.py")
 
 
+def test_main_version(monkeypatch, capsys):
+    monkeypatch.setattr(sys, "argv", ["pickley", "--version"])
+    __main__.main()
+    assert capsys.readouterr().out == f"{__version__}\n"
+
+
 def test_package_pex(cli, monkeypatch):
     cli.run("--dryrun", "-ppex", "package", cli.project_folder)
     assert cli.succeeded
@@ -418,6 +438,41 @@ def test_package_venv_with_additional_packages(cli):
     runez.delete("/tmp/pickley")
 
 
+def test_prefetch(temp_cfg):
+    seen = []
+    specs = [PackageSpec(temp_cfg, "mgit==1.0"), PackageSpec(temp_cfg, "tox==2.0")]
+    prefetch(specs[:1], lambda p: seen.append(p.dashed))
+    assert seen == ["mgit"]
+
+    prefetch(specs, lambda p: seen.append(p.dashed))
+    assert sorted(seen) == ["mgit", "mgit", "tox"]
+
+    with pytest.raises(SystemExit):
+        prefetch(specs, lambda p: sys.exit(1))
+
+    with patch("pickley.PackageSpec.get_latest") as get_latest:
+        prefetch_latest_versions(specs)  # Explicit versions need no pypi lookup
+        prefetch_latest_versions([PackageSpec(temp_cfg, "mgit")])  # Single package: looked up in-line by perform_install()
+        assert not get_latest.called
+
+        prefetch_latest_versions([PackageSpec(temp_cfg, "mgit"), PackageSpec(temp_cfg, "tox")])
+        assert get_latest.call_count == 2
+
+
+def test_rotate_log(temp_folder):
+    rotate_log("foo.log", 10)  # No-op when log file does not exist
+    assert not os.path.exists("foo.log.1")
+
+    runez.write("foo.log", "0123456789", logger=False)
+    rotate_log("foo.log", 20)
+    assert os.path.exists("foo.log")
+    assert not os.path.exists("foo.log.1")
+
+    rotate_log("foo.log", 10)
+    assert not os.path.exists("foo.log")
+    assert list(runez.readlines("foo.log.1")) == ["0123456789"]
+
+
 def test_version_check(cli):
     cli.run("version-check")
     assert cli.failed
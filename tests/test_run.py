@@ -1,5 +1,12 @@
+import os
+from unittest.mock import patch
+
+import runez
+
 from pickley.cli import RunSetup
 
+from .conftest import dot_meta
+
 
 def test_run(cli):
     cli.run("run --help")
@@ -22,6 +29,21 @@ def test_run(cli):
     assert "aws foo -bar" in cli.logged
 
 
+def test_run_exec(cli):
+    runez.save_json(dict(version="1.0"), dot_meta("mgit.manifest.json"))
+    cli.run("run mgit foo")
+    assert cli.failed
+    assert "mgit' is not available" in cli.logged
+
+    runez.write("mgit", "#!/bin/sh", logger=False)
+    runez.make_executable("mgit", logger=False)
+    with patch("os.execv") as execv:
+        cli.run("run mgit foo")
+        assert cli.succeeded
+        path = os.path.abspath("mgit")
+        execv.assert_called_once_with(path, [path, "foo"])
+
+
 def test_run_setup():
     rs = RunSetup.cmd_pip_compile()
     assert str(rs) == "pip-tools:pip-compile"